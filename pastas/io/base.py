@@ -109,7 +109,7 @@ def load_project(data):
                 mls.del_model(ml_name)
             except:
                 pass
-            print("model", ml_name, "could not be added")
+            logger.warning("Model {} could not be added".format(ml_name))
     return mls
 
 
@@ -7,7 +7,6 @@ R.A. Collenteur - August 2017
 """
 
 import json
-from collections import OrderedDict
 
 from pandas import Series, Timedelta, DataFrame, read_json, Timestamp, \
     to_numeric, isna
@@ -43,8 +42,7 @@ def pastas_hook(obj):
             else:
                 obj[key] = Timedelta(value)
         elif key in ["parameters", "pcov"]:
-            # Necessary to maintain order when using the JSON format!
-            value = json.loads(value, object_pairs_hook=OrderedDict)
+            value = json.loads(value)
             param = DataFrame(data=value, columns=value.keys()).T
             obj[key] = param.apply(to_numeric, errors="ignore")
         else:
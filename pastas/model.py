@@ -10,10 +10,15 @@ Examples
 """
 
 from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor, ProcessPoolExecutor
 from copy import copy
+from hashlib import blake2b
 from inspect import isclass
 from logging import getLogger
-from os import getlogin
+from os import getlogin, cpu_count, fdopen, makedirs, path, remove, replace
+import pickle
+from tempfile import mkstemp
+from threading import Lock
 
 import numpy as np
 import pandas as pd
@@ -83,7 +88,7 @@ class Model:
                      "stderr"])
 
         # Define the model components
-        self.stressmodels = OrderedDict()
+        self.stressmodels = {}
         self.constant = None
         self.transform = None
         self.noisemodel = None
@@ -98,6 +103,7 @@ class Model:
             "noise": noisemodel,
             "solver": None,
             "fit_constant": True,
+            "parallel": False,
         }
 
         if constant:
@@ -113,15 +119,43 @@ class Model:
         # initialize some attributes for solving and simulation
         self.sim_index = None
         self.oseries_calib = None
+        self.odelt_calib = None
         self.interpolate_simulation = None
+        self._obs_positions = None
         self.normalize_residuals = False
         self.fit = None
+        self._simulate_cache = None  # only used while solving
+        self._sim_index_cache = {}
+        self._response_cache = {}
+        self._lock = Lock()
+        self._pool = None
 
         # Load other modules
         self.stats = Statistics(self)
         self.plots = Plotting(self)
         self.plot = self.plots.plot  # because we are lazy
 
+    def __getstate__(self):
+        # The thread lock and pool can not be copied or pickled
+        state = self.__dict__.copy()
+        state.pop("_lock", None)
+        state["_pool"] = None
+        return state
+
+    def __setstate__(self, state):
+        self.__dict__.update(state)
+        self._lock = Lock()
+
+    @property
+    def parameters(self):
+        """pandas.DataFrame with the parameters of all model components."""
+        return self._parameters
+
+    @parameters.setter
+    def parameters(self, parameters):
+        self._parameters = parameters
+        self._param_slices = None
+
     def __repr__(self):
         """Prints a simple string representation of the model.
         """
@@ -168,6 +202,8 @@ class Model:
                               "another name.")
         else:
             self.stressmodels[stressmodel.name] = stressmodel
+            self._shutdown_pool()
+            self._response_cache.clear()
             self.parameters = self.get_init_parameters(initial=False)
             if self.settings["freq"] is None:
                 self._set_freq()
@@ -258,6 +294,8 @@ class Model:
 
         """
         self.stressmodels.pop(name, None)
+        self._shutdown_pool()
+        self._response_cache.clear()
         self.parameters = self.get_init_parameters(initial=False)
 
     def del_constant(self):
@@ -328,6 +366,39 @@ class Model:
         get an idea of how the simulation looks with only the initial
         parameters and no calibration.
 
+        The contributions of multiple stressmodels can be computed in
+        separate threads by setting ml.settings["parallel"] = True. This
+        is only faster for long simulations with expensive stressmodels.
+
+        """
+        sim, tmin, tmax = self._simulate(parameters, tmin, tmax, freq, warmup)
+
+        # Respect provided tmin/tmax at this point, since warmup matters for
+        # simulation but should not be returned, unless return_warmup=True.
+        if not return_warmup:
+            sim = sim.loc[tmin:tmax]
+
+        if sim.hasnans:
+            sim = sim.dropna()
+            self.logger.warning('Nan-values were removed from the simulation.')
+
+        sim.name = 'Simulation'
+        return sim
+
+    def _simulate(self, parameters=None, tmin=None, tmax=None, freq=None,
+                  warmup=None):
+        """Internal method to simulate the time series model, including the
+        warmup period and without removing nan-values.
+
+        Returns
+        -------
+        sim: pandas.Series
+            pandas.Series with the simulation on the simulation index.
+        tmin: pandas.Timestamp
+            start of the simulation period, excluding the warmup.
+        tmax: pandas.Timestamp
+            end of the simulation period.
+
         """
         # Default options when tmin, tmax, freq and warmup are not provided.
         if tmin is None and self.settings['tmin']:
@@ -355,33 +426,107 @@ class Model:
         if parameters is None:
             parameters = self.get_parameters()
 
-        sim = pd.Series(data=np.zeros(sim_index.size, dtype=float),
-                        index=sim_index, fastpath=True)
+        # Sum the contributions in an array to prevent index alignment
+        sim = np.zeros(sim_index.size, dtype=float)
+
+        slices, istart = self._get_param_slices()
+        args = [(sm, parameters[sl], sim_index.min(), sim_index.max(), freq,
+                 dt) for sm, sl in slices]
+
+        # Simulate the stressmodels in separate threads if requested
+        if self.settings["parallel"] and len(args) > 1:
+            pool = self._get_pool()
+            contribs = [pool.submit(self._simulate_stressmodel, *arg)
+                        for arg in args]
+            contribs = [future.result() for future in contribs]
+        else:
+            contribs = [self._simulate_stressmodel(*arg) for arg in args]
 
-        istart = 0  # Track parameters index to pass to stressmodel object
-        for sm in self.stressmodels.values():
-            contrib = sm.simulate(parameters[istart: istart + sm.nparam],
-                                  sim_index.min(), sim_index.max(), freq, dt)
-            sim = sim.add(contrib)
-            istart += sm.nparam
+        for contrib in contribs:
+            if not contrib.index.equals(sim_index):
+                contrib = contrib.reindex(sim_index)
+            sim += contrib.values
         if self.constant:
-            sim = sim + self.constant.simulate(parameters[istart])
+            sim += self.constant.simulate(parameters[istart])
             istart += 1
         if self.transform:
             sim = self.transform.simulate(sim, parameters[
                                                istart:istart + self.transform.nparam])
 
-        # Respect provided tmin/tmax at this point, since warmup matters for
-        # simulation but should not be returned, unless return_warmup=True.
-        if not return_warmup:
-            sim = sim.loc[tmin:tmax]
+        sim = pd.Series(data=sim, index=sim_index, name="Simulation",
+                        fastpath=True)
+        return sim, tmin, tmax
 
-        if sim.hasnans:
-            sim = sim.dropna()
-            self.logger.warning('Nan-values were removed from the simulation.')
+    def _simulate_stressmodel(self, sm, p, tmin, tmax, freq, dt):
+        """Internal method to simulate the contribution of a stressmodel.
 
-        sim.name = 'Simulation'
-        return sim
+        While solving, contributions are cached by their parameters and
+        simulation period, so that stressmodels whose parameters did not
+        change are not convolved again (e.g., when the solver approximates
+        the jacobian). The cache only exists during the optimization.
+
+        """
+        cache = self._simulate_cache
+        if cache is None:
+            return sm.simulate(p, tmin, tmax, freq, dt)
+
+        key = (sm, tuple(p), tmin, tmax, freq, dt)
+        with self._lock:
+            contrib = cache.get(key)
+            if contrib is not None:
+                cache.move_to_end(key)
+        if contrib is None:
+            contrib = sm.simulate(p, tmin, tmax, freq, dt)
+            with self._lock:
+                cache[key] = contrib
+                if len(cache) > 4 * len(self.stressmodels):
+                    cache.popitem(last=False)
+        return contrib
+
+    def _get_param_slices(self):
+        """Internal method to get the slices of the parameters array that
+        belong to each stressmodel.
+
+        Returns
+        -------
+        slices: list
+            list with tuples of the stressmodel and its parameter slice.
+        istart: int
+            index of the first parameter after those of the stressmodels.
+
+        Notes
+        -----
+        The slices are stored until ml.parameters is set again, which
+        happens whenever a model component is added or deleted.
+
+        """
+        if self._param_slices is None:
+            slices = []
+            istart = 0
+            for sm in self.stressmodels.values():
+                slices.append((sm, slice(istart, istart + sm.nparam)))
+                istart += sm.nparam
+            self._param_slices = (slices, istart)
+        return self._param_slices
+
+    def _get_pool(self):
+        """Internal method to get the thread pool used to simulate the
+        stressmodels in parallel, see the "parallel" setting.
+
+        """
+        if self._pool is None:
+            max_workers = min(len(self.stressmodels), cpu_count() or 1)
+            self._pool = ThreadPoolExecutor(max_workers=max_workers)
+        return self._pool
+
+    def _shutdown_pool(self):
+        """Internal method to shut down the thread pool, so a new pool is
+        sized to the stressmodels when it is needed again.
+
+        """
+        if self._pool is not None:
+            self._pool.shutdown(wait=False)
+            self._pool = None
 
     def residuals(self, parameters=None, tmin=None, tmax=None, freq=None,
                   warmup=None):
@@ -423,16 +568,19 @@ class Model:
         else:
             warmup = pd.Timedelta(days=warmup)
 
-        # simulate model
-        sim = self.simulate(parameters, tmin, tmax, freq, warmup,
-                            return_warmup=False)
+        # simulate model, the warmup and nan-values are not removed as only
+        # the values at the observations are used.
+        sim = self._simulate(parameters, tmin, tmax, freq, warmup)[0]
 
         # Get the oseries calibration series
         oseries_calib = self.observations(tmin, tmax, freq)
 
         # Get simulation at the correct indices
-        if self.interpolate_simulation is None:
-            if oseries_calib.index.difference(sim.index).size is not 0:
+        positions = None
+        if not self.interpolate_simulation:
+            positions = self._get_obs_positions(sim.index,
+                                                oseries_calib.index)
+            if positions is None and self.interpolate_simulation is None:
                 self.interpolate_simulation = True
                 self.logger.info('There are observations between the '
                                  'simulation timesteps. Linear interpolation '
@@ -441,23 +589,61 @@ class Model:
             # interpolate simulation to times of observations
             sim_interpolated = np.interp(oseries_calib.index.asi8,
                                          sim.index.asi8, sim.values)
+        elif positions is None:
+            sim_interpolated = sim.reindex(oseries_calib.index).values
         else:
             # all of the observation indexes are in the simulation
-            sim_interpolated = sim.reindex(oseries_calib.index)
-
-        # Calculate the actual residuals here
-        res = oseries_calib.subtract(sim_interpolated)
-
-        if res.hasnans:
-            res = res.dropna()
+            sim_interpolated = sim.values[positions]
+
+        # Calculate the actual residuals here, using the raw arrays to
+        # prevent index alignment by pandas.
+        res = oseries_calib.values - sim_interpolated
+        index = oseries_calib.index
+
+        # A single reduction is cheaper than building a boolean mask on every
+        # call; the mask is only computed when a nan is actually present.
+        if np.isnan(res.sum()):
+            nans = np.isnan(res)
+            res = res[~nans]
+            index = index[~nans]
             self.logger.warning('Nan-values were removed from the residuals.')
 
         if self.normalize_residuals:
-            res = res - res.values.mean()
+            res = res - res.mean()
 
-        res.name = "Residuals"
+        res = pd.Series(data=res, index=index, name="Residuals",
+                        fastpath=True)
         return res
 
+    def _get_obs_positions(self, sim_index, obs_index):
+        """Internal method to get the positions of the observations in the
+        simulation index.
+
+        The positions are stored for the last combination of indices, so
+        they are only determined once during the optimization. None is
+        returned if not all observations are present in the simulation.
+
+        Notes
+        -----
+        The simulation index is always sorted, so the positions are found
+        with a binary search on the integer representation of the indices.
+
+        """
+        if self._obs_positions is None or \
+                self._obs_positions[0] is not sim_index or \
+                self._obs_positions[1] is not obs_index:
+            sim_i8 = sim_index.asi8
+            obs_i8 = obs_index.asi8
+            if sim_i8.size == 0:
+                positions = None if obs_i8.size else np.empty(0, dtype=int)
+            else:
+                positions = np.searchsorted(sim_i8, obs_i8)
+                np.minimum(positions, sim_i8.size - 1, out=positions)
+                if (sim_i8[positions] != obs_i8).any():
+                    positions = None
+            self._obs_positions = (sim_index, obs_index, positions)
+        return self._obs_positions[2]
+
     def noise(self, parameters=None, tmin=None, tmax=None, freq=None,
               warmup=None):
         """Method to simulate the noise when a noisemodel is present.
@@ -507,9 +693,17 @@ class Model:
         # Calculate the residuals
         res = self.residuals(parameters, tmin, tmax, freq, warmup)
 
+        # Use the precomputed time steps if no observations were dropped
+        if self.oseries_calib is not None and \
+                res.index is self.oseries_calib.index:
+            odelt = self.odelt_calib
+        else:
+            odelt = None
+
         # Calculate the noise
         noise = self.noisemodel.simulate(res,
-                                         parameters[-self.noisemodel.nparam:])
+                                         parameters[-self.noisemodel.nparam:],
+                                         odelt=odelt)
         return noise
 
     def observations(self, tmin=None, tmax=None, freq=None,
@@ -614,6 +808,7 @@ class Model:
             self.settings["fit_constant"] = fit_constant
 
         # make sure calibration data is renewed
+        self._sim_index_cache.clear()
         self.sim_index = self.get_sim_index(self.settings["tmin"],
                                             self.settings["tmax"],
                                             self.settings["freq"],
@@ -623,7 +818,11 @@ class Model:
                                                tmax=self.settings["tmax"],
                                                freq=self.settings["freq"],
                                                update_observations=True)
+        index = self.oseries_calib.index
+        self.odelt_calib = (index[1:] - index[:-1]).values / \
+                           pd.Timedelta("1d")
         self.interpolate_simulation = None
+        self._response_cache.clear()
 
         # Initialize parameters
         self.parameters = self.get_init_parameters(noise, initial)
@@ -636,7 +835,7 @@ class Model:
 
     def solve(self, tmin=None, tmax=None, freq=None, warmup=None, noise=True,
               solver=None, report=True, initial=True, weights=None,
-              fit_constant=True, **kwargs):
+              fit_constant=True, cache=False, **kwargs):
         """Method to solve the time series model.
 
         Parameters
@@ -676,6 +875,11 @@ class Model:
             Argument that determines if the constant is fitted as a parameter.
             If it is set to False, the constant is set equal to the mean of
             the residuals.
+        cache: bool or str, optional
+            Store the results of the optimization on disk and reuse them when
+            the model is solved again with exactly the same input. If a
+            string is provided, it is used as the cache directory. If True,
+            the directory "~/.cache/pastas" is used. Default is False.
         **kwargs: dict, optional
             All keyword arguments will be passed onto minimization method
             from the solver. It depends on the solver used which arguments
@@ -688,10 +892,77 @@ class Model:
         matrix (ml.fit.pcor).
         - Each solver return a number of results after optimization. These
         solver specific results are stored in ml.fit.result and can be
-        accessed from there.
+        accessed from there. When the results are loaded from the cache,
+        ml.fit.result is None.
 
         """
 
+        self._initialize_solve(tmin, tmax, freq, warmup, noise, solver,
+                               initial, weights, fit_constant)
+
+        if cache:
+            fname = self._get_cache_fname(cache, noise, kwargs)
+        else:
+            fname = None
+
+        # Solve model, or load the results from an earlier optimization
+        if fname is not None and path.exists(fname):
+            with open(fname, "rb") as file:
+                success, optimal, stderr, fit = pickle.load(file)
+            self.fit = self.fit.__class__(ml=self, **fit)
+            self.logger.info("Optimization results loaded from "
+                             "{}".format(fname))
+        else:
+            self._simulate_cache = OrderedDict()
+            try:
+                success, optimal, stderr = self.fit.solve(noise=noise,
+                                                          weights=weights,
+                                                          **kwargs)
+            finally:
+                self._simulate_cache = None
+            if fname is not None:
+                fit = {"pcov": self.fit.pcov, "nfev": self.fit.nfev}
+                # Write to a temporary file first, so an interrupted run
+                # cannot leave a truncated file in the cache.
+                fd, fname_tmp = mkstemp(dir=path.dirname(fname))
+                try:
+                    with fdopen(fd, "wb") as file:
+                        pickle.dump((success, optimal, stderr, fit), file)
+                    replace(fname_tmp, fname)
+                except BaseException:
+                    remove(fname_tmp)
+                    raise
+        self._set_solve_results(success, optimal, stderr, report)
+
+    def _set_solve_results(self, success, optimal, stderr, report=True):
+        """Internal method to store the results of an optimization in the
+        parameters DataFrame, used by solve and solve_multi.
+
+        """
+        if not success:
+            self.logger.warning("Model parameters could not be estimated "
+                                "well.")
+
+        if not self.settings['fit_constant']:
+            # Determine the residuals and add their mean to the constant
+            self.normalize_residuals = False
+            res = self.residuals(optimal).mean()
+            optimal[self.parameters.name == self.constant.name] += res
+
+        self.parameters.optimal = optimal
+        self.parameters.stderr = stderr
+
+        if report:
+            print(self.fit_report())
+
+    def _initialize_solve(self, tmin=None, tmax=None, freq=None, warmup=None,
+                          noise=True, solver=None, initial=True, weights=None,
+                          fit_constant=True):
+        """Internal method to initialize the model and the solver instance
+        before solving. See the solve-method for a description of the
+        arguments.
+
+        """
         # Initialize the model
         self.initialize(tmin, tmax, freq, warmup, noise, weights, initial,
                         fit_constant)
@@ -709,24 +980,91 @@ class Model:
 
         self.settings["solver"] = self.fit._name
 
-        # Solve model
-        success, optimal, stderr = self.fit.solve(noise=noise, weights=weights,
-                                                  **kwargs)
-        if not success:
-            self.logger.warning("Model parameters could not be estimated "
-                                "well.")
+    def _get_cache_fname(self, cache, noise, kwargs):
+        """Internal method to get the file name to cache the results of an
+        optimization, based on a hash of all the input of the optimization.
 
-        if not self.settings['fit_constant']:
-            # Determine the residuals and set the constant to their mean
-            self.normalize_residuals = False
-            res = self.residuals(optimal).mean()
-            optimal[self.parameters.name == self.constant.name] = res
+        """
+        if cache is True:
+            cache = path.join(path.expanduser("~"), ".cache", "pastas")
+        makedirs(cache, exist_ok=True)
+
+        data = self.to_dict(series=True, file_info=False)
+        data.pop("fit", None)
+        data["parameters"] = self.parameters.loc[:, ["initial", "pmin",
+                                                     "pmax", "vary"]]
+        data["solve"] = (noise, kwargs, __version__)
+        try:
+            key = blake2b(pickle.dumps(data), digest_size=20).hexdigest()
+        except (pickle.PicklingError, AttributeError, TypeError):
+            self.logger.warning("The input of the optimization cannot be "
+                                "hashed, the results are not cached.")
+            return None
 
-        self.parameters.optimal = optimal
-        self.parameters.stderr = stderr
+        return path.join(cache, "{}.pkl".format(key))
 
-        if report:
-            print(self.fit_report())
+    def solve_multi(self, initial, n_workers=None, report=True, **kwargs):
+        """Method to solve the model from multiple sets of initial parameters.
+
+        Parameters
+        ----------
+        initial: pandas.DataFrame
+            Pandas DataFrame with a set of initial parameters on each row and
+            the parameter names as columns. Parameters that are not in the
+            columns keep their current initial value.
+        n_workers: int, optional
+            Number of processes used to solve the model. Default is None,
+            which uses the number of processors on the machine.
+        report: bool, optional
+            Print a report of the best fit to the screen.
+        **kwargs: dict, optional
+            All keyword arguments are passed onto the solve-method, e.g.
+            noise, tmin, tmax and solver.
+
+        Returns
+        -------
+        results: pandas.DataFrame
+            Pandas DataFrame with the optimal parameters and the sum of the
+            squared residuals or noise ("objective") for each set of initial
+            parameters.
+
+        Notes
+        -----
+        Each set of initial parameters is solved on a copy of the model in a
+        separate process. Afterwards, the optimal parameters, standard errors
+        and covariances of the set with the lowest objective are stored in
+        ml.parameters and ml.fit. The solver specific results are not
+        returned by the processes, so ml.fit.result is None.
+
+        Examples
+        --------
+        >>> initial = pd.DataFrame({"recharge_a": [10, 100, 1000]})
+        >>> results = ml.solve_multi(initial)
+
+        """
+        initial = pd.DataFrame(initial)
+        data = pickle.dumps(self)
+
+        with ProcessPoolExecutor(max_workers=n_workers) as pool:
+            futures = [pool.submit(_solve_initial, data, p.to_dict(), kwargs)
+                       for _, p in initial.iterrows()]
+            results, fits = zip(*[future.result() for future in futures])
+
+        results = pd.DataFrame(list(results), index=initial.index)
+
+        # Store the results of the best set of parameters in the model
+        ibest = results.objective.values.argmin()
+        success, optimal, stderr, fit = fits[ibest]
+        names = ["tmin", "tmax", "freq", "warmup", "noise", "solver",
+                 "weights", "fit_constant"]
+        self._initialize_solve(**{name: kwargs[name] for name in names
+                                  if name in kwargs})
+        for name, value in initial.iloc[ibest].items():
+            self.set_initial(name, value)
+        self.fit = self.fit.__class__(ml=self, **fit)
+        self._set_solve_results(success, optimal, stderr, report)
+
+        return results
 
     def set_initial(self, name, value, move_bounds=False):
         """Method to set the initial value of any parameter.
@@ -907,6 +1245,13 @@ class Model:
             Pandas DatetimeIndex instance with the datetimes values for
             which the model is simulated.
 
+        Notes
+        -----
+        The simulation indices are cached for each combination of tmin,
+        tmax and freq, so that repeated simulations for the same period do
+        not create a new DatetimeIndex. The cache is cleared when the model
+        is initialized.
+
         """
         # Check if any of the settings are updated
         for key, setting in zip([tmin, tmax, freq, warmup],
@@ -916,7 +1261,14 @@ class Model:
 
         if self.sim_index is None or update_sim_index:
             tmin = (tmin - warmup).floor(freq) + self.settings["time_offset"]
-            sim_index = pd.date_range(tmin, tmax, freq=freq)
+            key = (tmin, tmax, freq)
+            sim_index = self._sim_index_cache.get(key)
+            if sim_index is None:
+                sim_index = pd.date_range(tmin, tmax, freq=freq)
+                cache = self._sim_index_cache
+                if len(cache) >= 16:
+                    cache.pop(next(iter(cache)))  # remove the oldest index
+                cache[key] = sim_index
         else:
             sim_index = self.sim_index
         return sim_index
@@ -966,8 +1318,8 @@ class Model:
         # Get tmin from the oseries
         if use_oseries:
             ts_tmin = self.oseries.series.index.min()
-        # Get tmin from the stressmodels
-        elif use_stresses:
+        # Get tmin from the stressmodels, only needed if no tmin is provided
+        elif use_stresses and tmin is None:
             ts_tmin = pd.Timestamp.max
             for stressmodel in self.stressmodels.values():
                 if stressmodel.tmin < ts_tmin:
@@ -1038,8 +1390,8 @@ class Model:
         # Get tmax from the oseries
         if use_oseries:
             ts_tmax = self.oseries.series.index.max()
-        # Get tmax from the stressmodels
-        elif use_stresses:
+        # Get tmax from the stressmodels, only needed if no tmax is provided
+        elif use_stresses and tmax is None:
             ts_tmax = pd.Timestamp.min
             for stressmodel in self.stressmodels.values():
                 if stressmodel.tmax > ts_tmax:
@@ -1083,19 +1435,21 @@ class Model:
         if noise is None:
             noise = self.settings['noise']
 
-        parameters = pd.DataFrame(columns=["initial", "name", "optimal",
-                                           "pmin", "pmax", "vary", "stderr"])
-        for sm in self.stressmodels.values():
-            parameters = parameters.append(sm.parameters, sort=False)
+        columns = ["initial", "name", "optimal", "pmin", "pmax", "vary",
+                   "stderr"]
+        frames = [sm.parameters for sm in self.stressmodels.values()]
         if self.constant:
-            parameters = parameters.append(self.constant.parameters,
-                                           sort=False)
+            frames.append(self.constant.parameters)
         if self.transform:
-            parameters = parameters.append(self.transform.parameters,
-                                           sort=False)
+            frames.append(self.transform.parameters)
         if self.noisemodel and noise:
-            parameters = parameters.append(self.noisemodel.parameters,
-                                           sort=False)
+            frames.append(self.noisemodel.parameters)
+
+        # Concatenate all parameters at once instead of appending each frame
+        if frames:
+            parameters = pd.concat(frames, sort=False).reindex(columns=columns)
+        else:
+            parameters = pd.DataFrame(columns=columns)
 
         # Set initial parameters to optimal parameters from model
         if not initial:
@@ -1281,19 +1635,39 @@ class Model:
         Returns
         -------
 
+        Notes
+        -----
+        The computed responses are stored on the model for each combination
+        of response function, parameters and time step, so repeated calls
+        (e.g. when plotting after a fit) do not recompute the response.
+
         """
         if not hasattr(self.stressmodels[name], "rfunc"):
             raise TypeError("Stressmodel {} has no rfunc".format(name))
-        else:
-            block_or_step = getattr(self.stressmodels[name].rfunc,
-                                    block_or_step)
+        rfunc = self.stressmodels[name].rfunc
 
         if parameters is None:
             parameters = self.get_parameters(name)
 
         if dt is None:
             dt = get_dt(self.settings["freq"])
-        response = block_or_step(parameters, dt, **kwargs)
+
+        if isinstance(dt, np.ndarray):
+            # Responses for an array of time steps are not cached
+            response = getattr(rfunc, block_or_step)(parameters, dt, **kwargs)
+        else:
+            # The settings of the rfunc (e.g. cutoff) are part of the key
+            key = (rfunc, tuple(sorted(vars(rfunc).items())), block_or_step,
+                   tuple(parameters), dt, tuple(sorted(kwargs.items())))
+            cache = self._response_cache
+            response = cache.get(key)
+            if response is None:
+                response = getattr(rfunc, block_or_step)(parameters, dt,
+                                                         **kwargs)
+                if len(cache) >= 16:
+                    cache.pop(next(iter(cache)))  # remove the oldest response
+                cache[key] = response
+            response = response.copy()
 
         if add_0:
             response = np.insert(response, 0, 0.0)
@@ -1678,3 +2052,24 @@ class Model:
         ml = load_model(self.to_dict())
         ml.name = name
         return ml
+
+
+def _solve_initial(data, initial, kwargs):
+    """Internal function to solve a pickled model from a set of initial
+    parameters. Used by Model.solve_multi in the worker processes.
+
+    """
+    ml = pickle.loads(data)
+    for name, value in initial.items():
+        ml.set_initial(name, value)
+    ml.solve(report=False, **kwargs)
+
+    rv = ml.fit.misfit(ml.parameters.optimal.values, ml.settings["noise"],
+                       ml.settings["weights"])
+
+    result = ml.parameters.optimal.to_dict()
+    result["objective"] = rv.dot(rv)
+    success = getattr(ml.fit.result, "success", True)
+    fit = {"pcov": ml.fit.pcov, "nfev": ml.fit.nfev}
+    return result, (success, ml.parameters.optimal.values,
+                    ml.parameters.stderr.values, fit)
@@ -78,7 +78,7 @@ included in Pastas. To obtain a list of all statistics that are included type:
         """
         res = self.ml.residuals(tmin=tmin, tmax=tmax).values
         N = res.size
-        return sqrt((res ** 2).sum() / N)
+        return sqrt(res.dot(res) / N)
 
     @model_tmin_tmax
     def rmsn(self, tmin=None, tmax=None):
@@ -101,7 +101,7 @@ included in Pastas. To obtain a list of all statistics that are included type:
         else:
             res = self.ml.noise(tmin=tmin, tmax=tmax).values
             N = res.size
-            return sqrt((res ** 2).sum() / N)
+            return sqrt(res.dot(res) / N)
 
     @model_tmin_tmax
     def sse(self, tmin=None, tmax=None):
@@ -117,7 +117,7 @@ included in Pastas. To obtain a list of all statistics that are included type:
 
         """
         res = self.ml.residuals(tmin=tmin, tmax=tmax).values
-        return (res ** 2).sum()
+        return res.dot(res)
 
     @model_tmin_tmax
     def avg_dev(self, tmin=None, tmax=None):
@@ -146,7 +146,8 @@ included in Pastas. To obtain a list of all statistics that are included type:
         """
         res = self.ml.residuals(tmin=tmin, tmax=tmax).values
         obs = self.ml.observations(tmin=tmin, tmax=tmax).values
-        E = 1 - (res ** 2).sum() / ((obs - obs.mean()) ** 2).sum()
+        dev = obs - obs.mean()
+        E = 1 - res.dot(res) / dev.dot(dev)
         return E
 
     @model_tmin_tmax
@@ -175,8 +176,9 @@ included in Pastas. To obtain a list of all statistics that are included type:
         """
         obs = self.ml.observations(tmin=tmin, tmax=tmax).values
         res = self.ml.residuals(tmin=tmin, tmax=tmax).values
-        RSS = (res ** 2.0).sum()
-        TSS = ((obs - obs.mean()) ** 2.0).sum()
+        dev = obs - obs.mean()
+        RSS = res.dot(res)
+        TSS = dev.dot(dev)
         return 1.0 - RSS / TSS
 
     @model_tmin_tmax
@@ -199,8 +201,9 @@ included in Pastas. To obtain a list of all statistics that are included type:
         obs = self.ml.observations(tmin=tmin, tmax=tmax).values
         res = self.ml.residuals(tmin=tmin, tmax=tmax).values
         N = obs.size
-        RSS = (res ** 2.0).sum()
-        TSS = ((obs - obs.mean()) ** 2.0).sum()
+        dev = obs - obs.mean()
+        RSS = res.dot(res)
+        TSS = dev.dot(dev)
         nparam = self.ml.parameters.index.size
         return 1.0 - (N - 1.0) / (N - nparam) * RSS / TSS
 
@@ -224,7 +227,7 @@ included in Pastas. To obtain a list of all statistics that are included type:
             noise = self.ml.residuals(tmin=tmin, tmax=tmax).values
         n = noise.size
         nparam = self.ml.parameters[self.ml.parameters.vary == True].index.size
-        bic = -2.0 * log((noise ** 2.0).sum()) + nparam * log(n)
+        bic = -2.0 * log(noise.dot(noise)) + nparam * log(n)
         return bic
 
     @model_tmin_tmax
@@ -247,7 +250,7 @@ included in Pastas. To obtain a list of all statistics that are included type:
         else:
             noise = self.ml.residuals(tmin=tmin, tmax=tmax).values
         nparam = self.ml.parameters[self.ml.parameters.vary == True].index.size
-        aic = -2.0 * log((noise ** 2.0).sum()) + 2.0 * nparam
+        aic = -2.0 * log(noise.dot(noise)) + 2.0 * nparam
         return aic
 
     @model_tmin_tmax
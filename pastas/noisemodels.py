@@ -47,7 +47,7 @@ class NoiseModelBase(ABC):
         if name in self.parameters.index:
             self.parameters.loc[name, "initial"] = value
         else:
-            print("Warning:", name, "does not exist")
+            logger.warning("Parameter name {} does not exist".format(name))
 
     @set_parameter
     def set_pmin(self, name, value):
@@ -62,7 +62,7 @@ class NoiseModelBase(ABC):
         if name in self.parameters.index:
             self.parameters.loc[name, "pmin"] = value
         else:
-            print("Warning:", name, "does not exist")
+            logger.warning("Parameter name {} does not exist".format(name))
 
     @set_parameter
     def set_pmax(self, name, value):
@@ -76,7 +76,7 @@ class NoiseModelBase(ABC):
         if name in self.parameters.index:
             self.parameters.loc[name, "pmax"] = value
         else:
-            print("Warning:", name, "does not exist")
+            logger.warning("Parameter name {} does not exist".format(name))
 
     @set_parameter
     def set_vary(self, name, value):
@@ -128,8 +128,10 @@ class NoiseModel(NoiseModelBase):
         NoiseModelBase.__init__(self)
         self.nparam = 1
         self.set_init_parameters()
+        self._odelt = None
+        self._exp_cache = {}
 
-    def simulate(self, res, parameters):
+    def simulate(self, res, parameters, odelt=None):
         """
 
         Parameters
@@ -138,6 +140,9 @@ class NoiseModel(NoiseModelBase):
             The residual series.
         parameters : array-like, optional
             Alpha parameters used by the noisemodel.
+        odelt : numpy.ndarray, optional
+            Time steps between the residuals in days. Computed from the
+            index of res if not provided.
 
         Returns
         -------
@@ -146,13 +151,35 @@ class NoiseModel(NoiseModelBase):
 
         """
         alpha = parameters[0]
-        odelt = (res.index[1:] - res.index[:-1]).values / pd.Timedelta("1d")
-        # res.values is needed else it gets messed up with the dates
-        v = res.values[1:] - np.exp(-odelt / alpha) * res.values[:-1]
-        res.iloc[1:] = v * self.weights(alpha, odelt)
-        res.iloc[0] = 0
-        res.name = "Noise"
-        return res
+        if odelt is None:
+            odelt = (res.index[1:] - res.index[:-1]).values / \
+                    pd.Timedelta("1d")
+        exp, weights = self._get_exp(alpha, odelt)
+        v = _noise(res.values, exp)
+        v[1:] *= weights
+        return pd.Series(data=v, index=res.index, name="Noise", fastpath=True)
+
+    def _get_exp(self, alpha, odelt):
+        """Internal method to get the exponential decay factors and weights
+        for a value of alpha.
+
+        The factors only depend on alpha and the time steps, so they are
+        stored for the last 16 values of alpha used with the same odelt.
+        During the optimization alpha is unchanged when the other parameters
+        are perturbed to compute the Jacobian.
+
+        """
+        if odelt is not self._odelt:
+            self._odelt = odelt
+            self._exp_cache.clear()
+        cache = self._exp_cache
+        exp = cache.get(alpha)
+        if exp is None:
+            exp = np.exp(-odelt / alpha), self.weights(alpha, odelt)
+            if len(cache) >= 16:
+                cache.pop(next(iter(cache)))  # remove the oldest factors
+            cache[alpha] = exp
+        return exp
 
     @staticmethod
     def weights(alpha, odelt):
@@ -206,7 +233,7 @@ class NoiseModel2(NoiseModelBase):
         self.set_init_parameters()
 
     @staticmethod
-    def simulate(res, parameters):
+    def simulate(res, parameters, odelt=None):
         """
 
         Parameters
@@ -215,6 +242,9 @@ class NoiseModel2(NoiseModelBase):
             The residual series.
         parameters : array_like, optional
             Alpha parameters used by the noisemodel.
+        odelt : numpy.ndarray, optional
+            Time steps between the residuals in days. Computed from the
+            index of res if not provided.
 
         Returns
         -------
@@ -223,10 +253,18 @@ class NoiseModel2(NoiseModelBase):
 
         """
         alpha = parameters[0]
-        odelt = (res.index[1:] - res.index[:-1]).values / pd.Timedelta("1d")
-        # res.values is needed else it gets messed up with the dates
-        v = res.values[1:] - np.exp(-odelt / alpha) * res.values[:-1]
-        res.iloc[1:] = v
-        res.iloc[0] = 0
-        res.name = "Noise"
-        return res
+        if odelt is None:
+            odelt = (res.index[1:] - res.index[:-1]).values / \
+                    pd.Timedelta("1d")
+        v = _noise(res.values, np.exp(-odelt / alpha))
+        return pd.Series(data=v, index=res.index, name="Noise", fastpath=True)
+
+
+def _noise(res, exp):
+    """Internal function to calculate the noise from the residuals and the
+    exponential decay factors. The first value of the noise is zero.
+
+    """
+    v = np.zeros(res.size)
+    v[1:] = res[1:] - exp * res[:-1]
+    return v
@@ -222,18 +222,16 @@ class Plotting:
         fig.tight_layout(pad=0.0)
 
         # Draw parameters table
-        parameters = self.ml.parameters.copy()
-        parameters['name'] = parameters.index
         cols = ["name", "optimal", "stderr"]
-        parameters = parameters.loc[:, cols]
-        for name, vals in parameters.loc[:, cols].iterrows():
-            parameters.loc[name, "optimal"] = '{:.2f}'.format(vals.optimal)
-            stderr_perc = np.abs(np.divide(vals.stderr, vals.optimal) * 100)
-            parameters.loc[name, "stderr"] = '{:.1f}{}'.format(stderr_perc,
-                                                               "\u0025")
+        optimal = self.ml.parameters.optimal.values.astype(float)
+        stderr = self.ml.parameters.stderr.values.astype(float)
+        stderr_perc = np.abs(np.divide(stderr, optimal) * 100)
+        cell_text = np.column_stack([self.ml.parameters.index.values,
+                                     np.char.mod("%.2f", optimal),
+                                     np.char.mod("%.1f%%", stderr_perc)])
         ax3.axis('off')
         # loc='upper center'
-        ax3.table(bbox=(0., 0., 1.0, 1.0), cellText=parameters.values,
+        ax3.table(bbox=(0., 0., 1.0, 1.0), cellText=cell_text,
                   colWidths=[0.5, 0.25, 0.25], colLabels=cols)
 
         return fig.axes
@@ -56,6 +56,7 @@ class BaseSolver:
             self.pcor = self.get_correlations(pcov)
         self.nfev = nfev  # number of function evaluations
         self.result = None  # Object returned by the optimization method
+        self._weights = None  # Weights aligned with the misfit index
 
     def misfit(self, parameters, noise, weights=None, callback=None):
         """This method is called by all solvers to obtain a series that are
@@ -88,14 +89,28 @@ class BaseSolver:
 
         # Determine if weights need to be applied
         if weights is not None:
-            weights = weights.reindex(rv.index)
-            weights.fillna(1.0, inplace=True)
-            rv = rv.multiply(weights)
+            rv = rv.values * self._get_weights(weights, rv.index)
+        else:
+            rv = rv.values
 
         if callback:
             callback(parameters)
 
-        return rv.values
+        return rv
+
+    def _get_weights(self, weights, index):
+        """Internal method to get the weights as a float64 array aligned
+        with the index of the misfit.
+
+        The array is stored for the last combination of weights and index,
+        so the weights are only aligned once during the optimization.
+
+        """
+        if self._weights is None or self._weights[0] is not weights or \
+                self._weights[1] is not index:
+            values = weights.reindex(index).fillna(1.0).values
+            self._weights = (weights, index, values.astype(np.float64))
+        return self._weights[2]
 
     def prediction_interval(self, n=1000, alpha=0.05, **kwargs):
         """Method to calculate the prediction interval for the simulation.
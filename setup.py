@@ -31,12 +31,11 @@ setup(
         'Intended Audience :: Science/Research',
         'Intended Audience :: Other Audience',
         'License :: OSI Approved :: MIT License',
-        'Programming Language :: Python :: 3.5',
-        'Programming Language :: Python :: 3.6',
         'Programming Language :: Python :: 3.7',
         'Topic :: Scientific/Engineering :: Hydrology',
     ],
     platforms='Windows, Mac OS-X',
+    python_requires='>=3.7',
     install_requires=['numpy>=1.15', 'matplotlib>=2.0', 'pandas>=0.23',
                       'scipy>=1.1'],
     packages=find_packages(exclude=[]),
@@ -100,6 +100,17 @@ def test_get_step():
     return
 
 
+def test_get_block_cached():
+    ml = test_add_stressmodel()
+    b1 = ml.get_block_response("recharge")
+    b1[:] = 0.0
+    b2 = ml.get_block_response("recharge")
+    assert b2.abs().sum() > 0.0
+    ml.stressmodels["recharge"].rfunc.cutoff = 0.9
+    assert ml.get_block_response("recharge").size < b2.size
+    return
+
+
 def test_get_contribution():
     ml = test_add_stressmodel()
     ml.get_contribution("recharge")
@@ -118,6 +129,38 @@ def test_simulate():
     return
 
 
+def test_simulate_parallel():
+    ml = test_add_stressmodel()
+    sm = ps.StressModel(ml.stressmodels["recharge"].prec.series_original,
+                        rfunc=ps.Gamma, name="prec", settings="prec")
+    ml.add_stressmodel(sm)
+    ml.initialize()
+    sim = ml.simulate()
+    ml.settings["parallel"] = True
+    ml.initialize()
+    assert (ml.simulate() == sim).all()
+    return
+
+
+def test_simulate_after_solve():
+    ml = test_add_stressmodel()
+    ml.solve(report=False)
+    sim = ml.simulate()
+    ml.stressmodels["recharge"].prec.series.values[:] *= 2.0
+    assert not (ml.simulate() == sim).all()
+    return
+
+
+def test_solve_stress_in_warmup(caplog):
+    ml = test_create_model()
+    rain = read_csv("tests/data/rain.csv", index_col=0, parse_dates=True,
+                    squeeze=True)
+    ml.add_stressmodel(ps.StressModel(rain, ps.Gamma, name="rain"))
+    ml.solve(noise=False, report=False)
+    assert "Nan-values were removed from the simulation." not in caplog.text
+    return
+
+
 def test_residuals():
     ml = test_add_stressmodel()
     ml.residuals()
@@ -1,4 +1,5 @@
-from pandas import read_csv
+import numpy as np
+from pandas import read_csv, DataFrame
 
 import pastas as ps
 
@@ -23,6 +24,17 @@ def test_least_squares():
     return ml
 
 
+def test_least_squares_weights():
+    ml = create_model()
+    weights = ml.oseries.series.copy()
+    weights[:] = np.linspace(0.5, 2.0, weights.size)
+    ml.solve(noise=False, weights=weights, report=False)
+    p = ml.parameters.optimal.values
+    ratio = ml.fit.misfit(p, False, weights) / ml.fit.misfit(p, False)
+    assert np.allclose(ratio, weights.reindex(ml.oseries_calib.index))
+    return ml
+
+
 def test_fit_constant():
     ml = create_model()
     ml.solve(fit_constant=False)
@@ -33,6 +45,29 @@ def test_no_noise():
     ml.solve(noise=False)
 
 
+def test_solve_cache(tmpdir):
+    ml = create_model()
+    ml.solve(cache=str(tmpdir), report=False)
+    optimal = ml.parameters.optimal.copy()
+    ml = create_model()
+    ml.solve(cache=str(tmpdir), report=False)
+    assert ml.fit.result is None
+    assert (ml.parameters.optimal == optimal).all()
+
+
+def test_solve_multi():
+    ml = create_model()
+    initial = DataFrame({"recharge_a": [10.0, 100.0, 1000.0]})
+    results = ml.solve_multi(initial, n_workers=2, report=False)
+    assert results.index.size == initial.index.size
+    # each set of initial parameters leads to a different optimization
+    assert not results.duplicated().any()
+    ibest = results.objective.idxmin()
+    best = results.loc[ibest, ml.parameters.index]
+    assert (ml.parameters.optimal == best).all()
+    assert ml.parameters.initial["recharge_a"] == initial.recharge_a[ibest]
+
+
 # test the uncertainty method here
 def test_pred_interval():
     ml = test_least_squares()